@@ -64,6 +64,22 @@
           sandboxProfile = sandboxConfig.config.system.path;
           sandboxEtc = sandboxConfig.config.system.build.etc;
 
+          # First-run caches for tools in the sandbox profile, seeded into every
+          # fresh home. The store path depends on the profile, so the template
+          # is rebuilt whenever the profile changes. matplotlib never re-validates
+          # its font list, so discover fonts the way the sandbox does at runtime:
+          # through the profile's fc-list and fonts.conf. Fonts reachable only
+          # through paths outside fontconfig are not picked up.
+          homeTemplate = pkgs.runCommand "yolo-home-template" { } ''
+            mkdir -p $out
+            export HOME=$out
+            export PATH=${sandboxProfile}/bin:$PATH
+            if [ -e ${sandboxEtc}/etc/fonts/fonts.conf ]; then
+              export FONTCONFIG_FILE=${sandboxEtc}/etc/fonts/fonts.conf
+            fi
+            python3 -c 'import matplotlib.font_manager'
+          '';
+
           sandbox-entrypoint = pkgs.writeShellApplication {
             name = "sandbox-entrypoint";
             text = builtins.readFile ./entrypoint.bash;
@@ -73,14 +89,27 @@
             name = "yolo";
             runtimeInputs = [
               pkgs.bubblewrap
+              pkgs.coreutils
               pkgs.direnv
+              pkgs.findutils
+              pkgs.getconf
               pkgs.jq
               pkgs.util-linux
             ];
             text =
               builtins.replaceStrings
-                [ "@SANDBOX_PROFILE@" "@SANDBOX_ETC@" "@SANDBOX_ENTRYPOINT@" ]
-                [ "${sandboxProfile}" "${sandboxEtc}" "${sandbox-entrypoint}" ]
+                [
+                  "@SANDBOX_PROFILE@"
+                  "@SANDBOX_ETC@"
+                  "@SANDBOX_ENTRYPOINT@"
+                  "@SANDBOX_HOME_TEMPLATE@"
+                ]
+                [
+                  "${sandboxProfile}"
+                  "${sandboxEtc}"
+                  "${sandbox-entrypoint}"
+                  "${homeTemplate}"
+                ]
                 (builtins.readFile ./yolo.bash);
           };
         in
@@ -1,5 +1,7 @@
 """Shared pytest fixtures for yolo sandbox integration tests."""
 
+import datetime
+import json
 import os
 import pwd
 import shutil
@@ -11,6 +13,14 @@ import pytest
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--load-report",
+        default=str(PROJECT_ROOT / "load_report.json"),
+        help="Path of the JSON scaling report written by load tests.",
+    )
+
+
 def _get_subid_count(path, user):
     """Return subid count for the last matching entry, or None."""
     p = Path(path)
@@ -53,6 +63,43 @@ def requires_wide_uid(wide_uid):
         pytest.skip("host lacks wide-UID support (subuid/subgid/newuidmap/newgidmap)")
 
 
+def _git(*args):
+    """Return stripped output of a git command in the project root, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=PROJECT_ROOT,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+@pytest.fixture(scope="session")
+def load_report(request, yolo_bin):
+    """Session-scoped list of load test results, written as JSON at the end of the session.
+
+    The report records the yolo build and git revision under test plus the host CPU
+    count, so reports from different releases and machines can be compared.
+    """
+    rows = []
+    yield rows
+    if rows:
+        report = {
+            "generated": datetime.datetime.now(datetime.UTC).isoformat(),
+            "yolo": str(Path(yolo_bin).parent.parent),
+            "git_revision": _git("rev-parse", "HEAD"),
+            "git_describe": _git("describe", "--always", "--dirty"),
+            "cpu_count": os.cpu_count(),
+            "results": rows,
+        }
+        path = Path(request.config.getoption("--load-report"))
+        path.write_text(json.dumps(report, indent=2) + "\n")
+
+
 @pytest.fixture(scope="session")
 def yolo_bin():
     """Build yolo once per test session, return binary path."""
@@ -127,3 +127,33 @@ def test_man_page_lookup(yolo):
     result = yolo("man", "-w", "bash", check=False)
     assert result.returncode == 0, f"man -w bash failed: {result.stderr}"
     assert result.stdout.strip(), "man -w bash should return a path"
+
+
+def test_home_seeded_with_matplotlib_cache(yolo):
+    """A fresh home already contains matplotlib's font cache from the home template."""
+    result = yolo("bash", "-c", "ls ~/.cache/matplotlib/fontlist-*.json", check=False)
+    assert result.returncode == 0, f"matplotlib font cache missing from home: {result.stderr}"
+
+
+def test_matplotlib_does_not_rebuild_font_cache(yolo):
+    """Importing matplotlib.pyplot uses the seeded cache instead of rebuilding it."""
+    result = yolo("python3", "-c", "import matplotlib.pyplot")
+    assert "building the font cache" not in result.stderr.lower(), result.stderr
+
+
+def test_matplotlib_cache_matches_runtime_fonts(yolo):
+    """The seeded font list matches one built from scratch inside the sandbox."""
+    script = (
+        "import matplotlib.font_manager as fm;"
+        " print('\\n'.join(sorted({f.fname for f in fm.fontManager.ttflist})))"
+    )
+    seeded = yolo("python3", "-c", script)
+    fresh = yolo("bash", "-c", f'MPLCONFIGDIR="$(mktemp -d)" python3 -c "{script}"')
+    assert seeded.stdout == fresh.stdout, "Seeded font list differs from the sandbox's fonts"
+
+
+def test_home_template_copy_is_ephemeral(yolo):
+    """Changes to seeded cache files do not leak into later runs."""
+    yolo("bash", "-c", "rm -rf ~/.cache/matplotlib")
+    result = yolo("bash", "-c", "ls ~/.cache/matplotlib/fontlist-*.json", check=False)
+    assert result.returncode == 0, "Each run should start from a fresh copy of the home template"
@@ -0,0 +1,86 @@
+"""Disk usage reporting and garbage collection tests."""
+
+import os
+import time
+
+import pytest
+
+DAY = 24 * 60 * 60
+
+
+@pytest.fixture
+def data_path(home_path):
+    """Path of the persistent yolo data directory for the test HOME."""
+    return home_path / ".local/share/yolo"
+
+
+def _make_file(path, size, age):
+    """Create a file of the given size whose atime and mtime are ``age`` seconds old."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def test_du_lists_subsystems(yolo, yolo_cmd):
+    """yolo du reports a line per persistent subsystem plus a total."""
+    yolo("true")
+    result = yolo_cmd("du")
+    names = [line.split("\t")[1] for line in result.stdout.strip().splitlines()]
+    for name in ("claude", "codex", "gemini", "containers"):
+        assert name in names, f"Expected {name} in du output: {result.stdout}"
+    assert names[-1] == "total"
+
+
+def test_gc_max_age(yolo_cmd, data_path):
+    """yolo gc --max-age removes old session logs and keeps recent ones."""
+    old = _make_file(data_path / "claude/projects/p/old.jsonl", 10, 10 * DAY)
+    new = _make_file(data_path / "codex/sessions/new.jsonl", 10, 2 * DAY)
+    yolo_cmd("gc", "--max-age", "5")
+    assert not old.exists(), "Session log older than --max-age should be removed"
+    assert new.exists(), "Session log newer than --max-age should be kept"
+
+
+def test_gc_max_age_boundary(yolo_cmd, data_path):
+    """--max-age N removes files just over N days old, not only those over N+1 days."""
+    over = _make_file(data_path / "claude/projects/p/over.jsonl", 10, 5 * DAY + 2 * 60 * 60)
+    under = _make_file(data_path / "claude/projects/p/under.jsonl", 10, 5 * DAY - 2 * 60 * 60)
+    yolo_cmd("gc", "--max-age", "5")
+    assert not over.exists(), "Session log just over --max-age should be removed"
+    assert under.exists(), "Session log just under --max-age should be kept"
+
+
+def test_gc_max_size_evicts_lru(yolo_cmd, data_path):
+    """yolo gc --max-size evicts least recently used files first."""
+    oldest = _make_file(data_path / "claude/projects/p/a.jsonl", 1024, 3 * DAY)
+    middle = _make_file(data_path / "codex/sessions/b.jsonl", 1024, 2 * DAY)
+    newest = _make_file(data_path / "gemini/tmp/c.json", 1024, 1 * DAY)
+    yolo_cmd("gc", "--max-size", "2K")
+    assert not oldest.exists(), "Least recently used file should be evicted"
+    assert middle.exists()
+    assert newest.exists()
+
+
+def test_gc_keeps_recent_files(yolo_cmd, data_path):
+    """Files modified within the grace period survive even an aggressive policy."""
+    active = _make_file(data_path / "claude/projects/p/active.jsonl", 1024, 0)
+    yolo_cmd("gc", "--max-size", "0", "--max-age", "0")
+    assert active.exists(), "Recently written session log should never be collected"
+
+
+def test_gc_keeps_persistent_config(yolo, yolo_cmd, data_path):
+    """yolo gc never touches state outside the agent session log directories."""
+    yolo("true")
+    claude_json = data_path / "claude/.claude.json"
+    os.utime(claude_json, (time.time() - 10 * DAY, time.time() - 10 * DAY))
+    yolo_cmd("gc", "--max-size", "0", "--max-age", "0")
+    assert claude_json.exists()
+
+
+def test_gc_invalid_option_prints_usage(yolo_cmd):
+    """yolo gc with an unknown option prints usage and exits non-zero."""
+    result = yolo_cmd("gc", "--bogus", check=False)
+    assert result.returncode != 0
+    combined = result.stdout + result.stderr
+    assert "usage" in combined.lower(), f"Expected usage message, got: {combined}"
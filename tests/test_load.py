@@ -0,0 +1,111 @@
+"""Concurrency load tests for mass parallel sandbox launches.
+
+Deselected by default; run with ``just load-test`` (``pytest tests/ -m load``).
+Each test launches many sandboxes against the same HOME at the same moment to
+exercise shared paths (the data directory setup, ``.claude.json``, the
+newuidmap handshake and podman's storage lock) and records throughput, tail
+latency and failure rate in the scaling report.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytestmark = pytest.mark.load
+
+LAUNCH_COUNTS = [10, 50, 200]
+
+WORKLOADS = {
+    "true": ["true"],
+    "podman": ["podman", "image", "ls"],
+}
+
+
+@pytest.fixture
+def narrow_env(sandbox_env):
+    """sandbox_env with newuidmap/newgidmap hidden from PATH, forcing the plain path."""
+    path = [
+        entry
+        for entry in sandbox_env["PATH"].split(os.pathsep)
+        if not (shutil.which("newuidmap", path=entry) or shutil.which("newgidmap", path=entry))
+    ]
+    return {**sandbox_env, "PATH": os.pathsep.join(path)}
+
+
+def _launch_concurrently(yolo_bin, project_path, env, args, count, timeout=600):
+    """Start ``count`` ``yolo run`` invocations at once; return (wall time, results)."""
+    barrier = threading.Barrier(count)
+
+    def launch():
+        barrier.wait()
+        start = time.monotonic()
+        try:
+            result = subprocess.run(
+                [yolo_bin, "run", *args],
+                capture_output=True,
+                text=True,
+                cwd=project_path,
+                env=env,
+                timeout=timeout,
+            )
+            error = None if result.returncode == 0 else result.stderr.strip()
+        except subprocess.TimeoutExpired:
+            error = f"timed out after {timeout} seconds"
+        except OSError as e:
+            # Resource exhaustion (EAGAIN from RLIMIT_NPROC, out of fds) counts as a failure
+            error = f"failed to start: {e}"
+        return time.monotonic() - start, error
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        results = list(pool.map(lambda _: launch(), range(count)))
+    return time.monotonic() - start, results
+
+
+def _summarize(path, workload, count, wall, results):
+    """Build a scaling report row from raw launch results."""
+    latencies = [latency for latency, _ in results]
+    errors = [error for _, error in results if error is not None]
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "path": path,
+        "workload": workload,
+        "concurrency": count,
+        "throughput_per_s": count / wall,
+        "latency_p50_s": cuts[49],
+        "latency_p95_s": cuts[94],
+        "latency_p99_s": cuts[98],
+        "latency_max_s": max(latencies),
+        "failures": len(errors),
+        "failure_rate": len(errors) / count,
+        "sample_error": errors[0] if errors else None,
+    }
+
+
+@pytest.mark.parametrize("count", LAUNCH_COUNTS)
+def test_concurrent_launch_plain(yolo_bin, project_path, narrow_env, load_report, count):
+    """Concurrent launches without wide-UID mapping all succeed."""
+    wall, results = _launch_concurrently(yolo_bin, project_path, narrow_env, ["true"], count)
+    row = _summarize("plain", "true", count, wall, results)
+    load_report.append(row)
+    assert row["failures"] == 0, f"{row['failures']}/{count} launches failed: {row['sample_error']}"
+
+
+@pytest.mark.parametrize("workload", WORKLOADS)
+@pytest.mark.parametrize("count", LAUNCH_COUNTS)
+def test_concurrent_launch_wide_uid(
+    yolo_bin, project_path, sandbox_env, requires_wide_uid, load_report, count, workload
+):
+    """Concurrent launches through the newuidmap handshake all succeed."""
+    wall, results = _launch_concurrently(
+        yolo_bin, project_path, sandbox_env, WORKLOADS[workload], count
+    )
+    row = _summarize("wide-uid", workload, count, wall, results)
+    load_report.append(row)
+    assert row["failures"] == 0, f"{row['failures']}/{count} launches failed: {row['sample_error']}"
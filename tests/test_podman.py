@@ -78,3 +78,47 @@ def test_podman_uid_mappings(yolo, requires_wide_uid):
     assert uid_total + 1 == sandbox_uid_total, (
         f"podman uid_total + 1 ({uid_total}) != sandbox uid_map total ({sandbox_uid_total})"
     )
+
+
+def _build_busybox_image(yolo, tag):
+    """Build a busybox image offline under the given tag."""
+    build_script = (
+        "set -e; dir=$(mktemp -d);"
+        " cp $(readlink -f $(which busybox)) $dir/busybox;"
+        " printf 'FROM scratch\\nCOPY busybox /busybox\\n' > $dir/Dockerfile;"
+        f" podman build -t {tag} $dir"
+    )
+    result = yolo("bash", "-c", build_script, check=False, timeout=120)
+    assert result.returncode == 0, f"podman build failed: {result.stderr}"
+
+
+def test_gc_prune_images(yolo, yolo_cmd, requires_wide_uid):
+    """yolo gc --prune-images removes dangling images and keeps tagged ones."""
+    _build_busybox_image(yolo, tag="busybox-keep")
+    # An untagged build of a new image leaves it dangling
+    dangling_script = (
+        "set -e; dir=$(mktemp -d);"
+        " printf 'FROM busybox-keep\\nENV DANGLING=1\\n' > $dir/Dockerfile;"
+        " podman build $dir"
+    )
+    yolo("bash", "-c", dangling_script, timeout=120)
+    result = yolo("podman", "images", "--filter", "dangling=true", "--quiet")
+    assert result.stdout.strip(), "Expected a dangling image before gc"
+
+    yolo_cmd("gc", "--prune-images", timeout=120)
+
+    result = yolo("podman", "images", "--filter", "dangling=true", "--quiet")
+    assert result.stdout.strip() == "", "Dangling images should be pruned"
+    result = yolo("podman", "image", "exists", "busybox-keep", check=False)
+    assert result.returncode == 0, "Tagged images should survive gc"
+
+
+def test_du_measures_container_storage(yolo, yolo_cmd, requires_wide_uid):
+    """yolo du measures podman storage fully, including subordinate-UID layers."""
+    _build_busybox_image(yolo, tag="busybox-du")
+    result = yolo_cmd("du", timeout=120)
+    assert "partial" not in result.stderr, result.stderr
+    sizes = dict(reversed(line.split("\t")) for line in result.stdout.strip().splitlines())
+    assert sizes["containers"].endswith(("M", "G")), (
+        f"Expected container storage to include the busybox image: {result.stdout}"
+    )
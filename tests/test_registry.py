@@ -0,0 +1,70 @@
+"""Sandbox registry tests for ``yolo ps`` and ``yolo top``."""
+
+import subprocess
+import time
+
+import pytest
+
+
+@pytest.fixture
+def running_sandbox(yolo_bin, project_path, sandbox_env):
+    """Start a long-running sandbox in the background; terminate it on teardown."""
+    proc = subprocess.Popen(
+        [yolo_bin, "run", "sleep", "60"],
+        cwd=project_path,
+        env=sandbox_env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    yield proc
+    proc.terminate()
+    proc.wait(timeout=10)
+
+
+def _find_entry(yolo_cmd, pid, timeout=10):
+    """Poll ``yolo ps`` until the sandbox with the given pid has a child PID, or return None."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for line in yolo_cmd("ps").stdout.splitlines()[1:]:
+            fields = line.split()
+            if fields[0] == str(pid) and fields[1] != "-":
+                return fields
+        time.sleep(0.2)
+    return None
+
+
+def test_ps_lists_running_sandbox(yolo_cmd, running_sandbox, project_path):
+    """A running sandbox appears in yolo ps with its child PID, subcommand and project."""
+    fields = _find_entry(yolo_cmd, running_sandbox.pid)
+    assert fields is not None, "Running sandbox should be listed by yolo ps"
+    assert fields[1].isdigit(), f"Expected numeric child PID, got {fields[1]}"
+    assert fields[4] == "run"
+    assert fields[5] == str(project_path)
+
+
+def test_ps_removes_finished_sandbox(yolo_cmd, running_sandbox):
+    """A sandbox disappears from yolo ps after it exits."""
+    assert _find_entry(yolo_cmd, running_sandbox.pid) is not None
+    running_sandbox.terminate()
+    running_sandbox.wait(timeout=10)
+    pids = [line.split()[0] for line in yolo_cmd("ps").stdout.splitlines()[1:]]
+    assert str(running_sandbox.pid) not in pids
+
+
+def test_top_reports_usage(yolo_cmd, running_sandbox, project_path):
+    """yolo top reports CPU, memory and process count for a running sandbox."""
+    assert _find_entry(yolo_cmd, running_sandbox.pid) is not None
+    result = yolo_cmd("top", "-d", "1", "-n", "1")
+    rows = {line.split()[0]: line.split() for line in result.stdout.splitlines()[1:]}
+    row = rows.get(str(running_sandbox.pid))
+    assert row is not None, f"Running sandbox missing from yolo top: {result.stdout}"
+    assert int(row[3]) >= 2, "Expected at least yolo and bwrap in the process tree"
+    assert row[5] == str(project_path)
+
+
+def test_top_invalid_option_prints_usage(yolo_cmd):
+    """yolo top with an unknown option prints usage and exits non-zero."""
+    result = yolo_cmd("top", "--bogus", check=False)
+    assert result.returncode != 0
+    combined = result.stdout + result.stderr
+    assert "usage" in combined.lower(), f"Expected usage message, got: {combined}"
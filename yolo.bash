@@ -77,6 +77,15 @@ has_wide_uid_support() {
   return 0
 }
 
+parse_child_pid() {
+  # Extract N from bwrap --info-fd JSON (format: {"child-pid": N, ...})
+  local child_pid="${1##*\"child-pid\":}"
+  child_pid="${child_pid#"${child_pid%%[0-9]*}"}"
+  child_pid="${child_pid%%[^0-9]*}"
+  [[ $child_pid =~ ^[0-9]+$ ]] || return 1
+  echo "$child_pid"
+}
+
 run_bwrap_wide_uid() {
   local uid gid
   uid="$(id -u)"
@@ -107,14 +116,10 @@ run_bwrap_wide_uid() {
     3>"$info_fifo" 4<"$block_fifo" &
   local bwrap_pid=$!
 
-  # Read child PID from info-fd JSON (format: {"child-pid": N, ...})
   local info_json child_pid
   info_json=$(cat "$info_fifo")
-  child_pid="${info_json##*\"child-pid\":}"
-  child_pid="${child_pid#"${child_pid%%[0-9]*}"}"
-  child_pid="${child_pid%%[^0-9]*}"
 
-  if [[ -z $child_pid || ! $child_pid =~ ^[0-9]+$ ]]; then
+  if ! child_pid="$(parse_child_pid "$info_json")"; then
     echo "yolo: failed to parse child PID from bwrap info: $info_json" >&2
     exec {block_fd}>&-
     kill "$bwrap_pid" 2>/dev/null || true
@@ -145,6 +150,8 @@ run_bwrap_wide_uid() {
     return 1
   fi
 
+  registry_set_child_pid "$child_pid" || true
+
   # Unblock bwrap by writing to the block fd, then close it
   echo >&"$block_fd"
   exec {block_fd}>&-
@@ -152,9 +159,202 @@ run_bwrap_wide_uid() {
   wait "$bwrap_pid"
 }
 
+get_registry_dir() {
+  if [[ -n ${XDG_RUNTIME_DIR:-} ]]; then
+    echo "$XDG_RUNTIME_DIR/yolo/sandboxes"
+  else
+    echo "${XDG_STATE_HOME:-$HOME/.local/state}/yolo/sandboxes"
+  fi
+}
+
+read_proc_stat() {
+  # Fields after the parenthesized comm (which may contain spaces), so
+  # PROC_STAT[0] is field 3 (state) of proc_pid_stat(5)
+  local stat
+  { read -r stat <"/proc/$1/stat"; } 2>/dev/null || return 1
+  read -ra PROC_STAT <<<"${stat##*) }"
+}
+
+register_sandbox() {
+  local registry_dir
+  registry_dir="$(get_registry_dir)"
+  mkdir -p -m 700 "$registry_dir" || return 1
+  read_proc_stat $$ || return 1
+
+  # Write to a temp file and rename so readers never see a partial entry;
+  # noclobber refuses to follow anything left at the temp path
+  local entry="$registry_dir/$$"
+  rm -f "$entry.tmp"
+  (
+    set -C
+    printf 'pid=%s\nstarttime=%s\nstarted=%s\nsubcommand=%s\nproject=%s\n' \
+      $$ "${PROC_STAT[19]}" "$(date +%s)" "$cmd" "$PWD" >"$entry.tmp"
+  ) || return 1
+  mv "$entry.tmp" "$entry" || return 1
+  registry_file="$entry"
+}
+
+registry_set_child_pid() {
+  [[ -n ${registry_file:-} && -f $registry_file ]] || return 0
+  echo "child_pid=$1" >>"$registry_file"
+}
+
+load_registry() {
+  # Populate REGISTRY_PIDS and REG_* maps from live entries, removing stale ones
+  # (process gone, or pid reused by a process with a different start time)
+  REGISTRY_PIDS=()
+  declare -gA REG_CHILD_PID=() REG_STARTED=() REG_SUBCOMMAND=() REG_PROJECT=()
+
+  local registry_dir entry
+  registry_dir="$(get_registry_dir)"
+  [[ -d $registry_dir ]] || return 0
+
+  for entry in "$registry_dir"/*; do
+    [[ -f $entry && $entry != *.tmp ]] || continue
+
+    local key value pid="" starttime="" child_pid="-" started="" subcommand="" project=""
+    while IFS='=' read -r key value; do
+      case "$key" in
+      pid) pid="$value" ;;
+      starttime) starttime="$value" ;;
+      child_pid) child_pid="$value" ;;
+      started) started="$value" ;;
+      subcommand) subcommand="$value" ;;
+      project) project="$value" ;;
+      esac
+    done <"$entry" 2>/dev/null || continue
+
+    if [[ -z $pid ]] || ! read_proc_stat "$pid" || [[ ${PROC_STAT[19]} != "$starttime" ]]; then
+      rm -f "$entry"
+      continue
+    fi
+
+    REGISTRY_PIDS+=("$pid")
+    REG_CHILD_PID[$pid]="$child_pid"
+    REG_STARTED[$pid]="$started"
+    REG_SUBCOMMAND[$pid]="$subcommand"
+    REG_PROJECT[$pid]="$project"
+  done
+}
+
+show_sandboxes() {
+  load_registry
+  printf '%-8s %-8s %-19s %-10s %s\n' PID CHILD STARTED SUBCOMMAND PROJECT
+  local pid
+  for pid in "${REGISTRY_PIDS[@]}"; do
+    printf '%-8s %-8s %-19s %-10s %s\n' "$pid" "${REG_CHILD_PID[$pid]}" \
+      "$(date -d "@${REG_STARTED[$pid]}" '+%F %T')" "${REG_SUBCOMMAND[$pid]}" "${REG_PROJECT[$pid]}"
+  done
+}
+
+snapshot_processes() {
+  declare -gA PROC_CHILDREN=() PROC_TICKS=() PROC_RSS=()
+  local dir pid
+  for dir in /proc/[0-9]*; do
+    pid="${dir#/proc/}"
+    read_proc_stat "$pid" || continue
+    PROC_CHILDREN[${PROC_STAT[1]}]+="$pid "
+    PROC_TICKS[$pid]=$((PROC_STAT[11] + PROC_STAT[12]))
+    PROC_RSS[$pid]="${PROC_STAT[21]}"
+  done
+}
+
+sum_process_tree() {
+  # Sum CPU ticks, RSS pages and process count over a snapshotted process tree
+  TREE_TICKS=0
+  TREE_RSS=0
+  TREE_PROCS=0
+  local queue=("$1") pid children
+  while [[ ${#queue[@]} -gt 0 ]]; do
+    pid="${queue[0]}"
+    queue=("${queue[@]:1}")
+    [[ -n ${PROC_TICKS[$pid]:-} ]] || continue
+    TREE_TICKS=$((TREE_TICKS + PROC_TICKS[$pid]))
+    TREE_RSS=$((TREE_RSS + PROC_RSS[$pid]))
+    TREE_PROCS=$((TREE_PROCS + 1))
+    read -ra children <<<"${PROC_CHILDREN[$pid]:-}"
+    queue+=("${children[@]}")
+  done
+}
+
+top_usage() {
+  echo "Usage: yolo top [-d SECONDS] [-n ITERATIONS]"
+  exit 1
+}
+
+show_top() {
+  local delay=2 iterations=0
+  while [[ $# -gt 0 ]]; do
+    case "$1" in
+    -d)
+      [[ $# -ge 2 && $2 =~ ^[1-9][0-9]*$ ]] || top_usage
+      delay="$2"
+      shift 2
+      ;;
+    -n)
+      [[ $# -ge 2 && $2 =~ ^[1-9][0-9]*$ ]] || top_usage
+      iterations="$2"
+      shift 2
+      ;;
+    *)
+      top_usage
+      ;;
+    esac
+  done
+
+  local clk_tck page_size
+  clk_tck="$(getconf CLK_TCK)"
+  page_size="$(getconf PAGESIZE)"
+
+  local -A prev_ticks=()
+  local pid iteration=0
+  snapshot_processes
+  load_registry
+  for pid in "${REGISTRY_PIDS[@]}"; do
+    sum_process_tree "$pid"
+    prev_ticks[$pid]="$TREE_TICKS"
+  done
+
+  while true; do
+    sleep "$delay"
+    snapshot_processes
+    load_registry
+
+    if [[ -t 1 ]]; then
+      printf '\033[H\033[2J'
+    fi
+    printf '%-8s %6s %9s %5s %-10s %s\n' PID CPU% MEM PROCS SUBCOMMAND PROJECT
+    local cpu delta
+    for pid in "${REGISTRY_PIDS[@]}"; do
+      sum_process_tree "$pid"
+      # Ticks of processes that exited during the interval are lost; clamp at zero
+      delta=$((TREE_TICKS - ${prev_ticks[$pid]:-$TREE_TICKS}))
+      ((delta >= 0)) || delta=0
+      cpu=$((delta * 1000 / (clk_tck * delay)))
+      printf '%-8s %4d.%d %9s %5s %-10s %s\n' "$pid" $((cpu / 10)) $((cpu % 10)) \
+        "$(numfmt --to=iec $((TREE_RSS * page_size)))" "$TREE_PROCS" \
+        "${REG_SUBCOMMAND[$pid]}" "${REG_PROJECT[$pid]}"
+      prev_ticks[$pid]="$TREE_TICKS"
+    done
+
+    iteration=$((iteration + 1))
+    if ((iterations > 0 && iteration >= iterations)); then
+      break
+    fi
+  done
+}
+
+get_data_dir() {
+  echo "${XDG_DATA_HOME:-$HOME/.local/share}/yolo"
+}
+
 run_sandbox() {
   tmpdir="$(mktemp -d)"
-  trap 'chmod -R u+rwx "$tmpdir" || true; rm -rf "$tmpdir"' EXIT
+  registry_file=""
+  trap 'chmod -R u+rwx "$tmpdir" || true; rm -rf "$tmpdir" "$registry_file"' EXIT
+
+  # The registry only feeds `yolo ps`/`yolo top`; never fail a launch over it
+  register_sandbox || echo "yolo: failed to register sandbox in $(get_registry_dir)" >&2
 
   local etc_dir="$tmpdir/etc"
   mkdir "$etc_dir"
@@ -162,13 +362,19 @@ run_sandbox() {
 
   local home_dir="$tmpdir/home"
   mkdir "$home_dir"
+  # Seed the home with tool caches prebuilt for this profile (e.g. matplotlib's
+  # font list) so they aren't regenerated on every run. This is a plain copy
+  # out of /nix/store (the template is small), which keeps runs isolated
+  cp -a "@SANDBOX_HOME_TEMPLATE@/." "$home_dir/"
+  chmod -R u+w "$home_dir"
 
   local user uid gid
   user="$(id -un)"
   uid="$(id -u)"
   gid="$(id -g)"
 
-  local data_dir="${XDG_DATA_HOME:-$HOME/.local/share}/yolo"
+  local data_dir
+  data_dir="$(get_data_dir)"
 
   local git_config_dir="$data_dir/git"
   mkdir -p "$git_config_dir"
@@ -291,13 +497,195 @@ run_sandbox() {
     run_bwrap_wide_uid "${bwrap_args[@]}" \
       -- @SANDBOX_ENTRYPOINT@/bin/sandbox-entrypoint "${entrypoint_args[@]}" "$@"
   else
-    "${BWRAP_CMD[@]}" "${bwrap_args[@]}" \
-      -- @SANDBOX_ENTRYPOINT@/bin/sandbox-entrypoint "${entrypoint_args[@]}" "$@"
+    # Record the child PID in the background; bwrap stays in the foreground
+    local info_fifo="$tmpdir/bwrap-info"
+    mkfifo "$info_fifo"
+    (
+      child_pid="$(parse_child_pid "$(cat "$info_fifo")")" &&
+        registry_set_child_pid "$child_pid"
+    ) &
+    local reader_pid=$!
+    local status=0
+    "${BWRAP_CMD[@]}" --info-fd 3 "${bwrap_args[@]}" \
+      -- @SANDBOX_ENTRYPOINT@/bin/sandbox-entrypoint "${entrypoint_args[@]}" "$@" \
+      3>"$info_fifo" || status=$?
+    # Let the reader finish before the EXIT trap removes the registry entry,
+    # otherwise its append could recreate the entry as an orphan
+    wait "$reader_pid" || true
+    return "$status"
   fi
 }
 
+# Session logs and caches that agents accumulate under the data dir.
+# These are safe to delete: agents recreate them on demand.
+GC_CACHE_DIRS=(
+  claude/projects
+  claude/todos
+  claude/debug
+  claude/shell-snapshots
+  claude/file-history
+  codex/sessions
+  codex/log
+  gemini/tmp
+)
+
+# Files touched within this many minutes are never collected, so gc can run
+# while other sandboxes are actively writing their session logs
+GC_GRACE_MINUTES=60
+
+run_scratch_sandbox() {
+  # Run a command in a separate yolo process (so errexit applies to sandbox
+  # setup) from an empty scratch directory: run_sandbox binds $PWD read-write,
+  # and a timer's working directory may be / or the real home
+  local scratch_dir status=0
+  scratch_dir="$(mktemp -d)"
+  (cd "$scratch_dir" && exec "$0" run "$@") || status=$?
+  rmdir "$scratch_dir"
+  return "$status"
+}
+
+du_kib() {
+  # Print the size of a path in KiB; fails if some of it could not be read,
+  # in which case the printed size is partial
+  local output status=0
+  output="$(du -sk "$1" 2>/dev/null)" || status=$?
+  echo "${output%%[[:space:]]*}"
+  return "$status"
+}
+
+containers_kib() {
+  # Image layers contain directories owned by subordinate UIDs that the host
+  # user cannot read, so measure from podman's user namespace in the sandbox
+  local output
+  output="$(run_scratch_sandbox podman unshare du -sk "$HOME/.local/share/containers")" || return 1
+  echo "${output%%[[:space:]]*}"
+}
+
+show_disk_usage() {
+  local data_dir
+  data_dir="$(get_data_dir)"
+  if [[ ! -d $data_dir ]]; then
+    echo "yolo: no data directory at $data_dir"
+    return 0
+  fi
+
+  local entry name kib total=0
+  for entry in "$data_dir"/*/; do
+    [[ -d $entry ]] || continue
+    entry="${entry%/}"
+    name="${entry##*/}"
+    if [[ $name == containers ]] && has_wide_uid_support &&
+      kib="$(containers_kib)" && [[ $kib =~ ^[0-9]+$ ]]; then
+      :
+    elif ! kib="$(du_kib "$entry")"; then
+      echo "yolo: some of $entry is unreadable; its size is partial" >&2
+    fi
+    total=$((total + ${kib:-0}))
+    printf '%s\t%s\n' "$(numfmt --from-unit=1024 --to=iec "${kib:-0}")" "$name"
+  done
+  printf '%s\t%s\n' "$(numfmt --from-unit=1024 --to=iec "$total")" total
+}
+
+gc_usage() {
+  echo "Usage: yolo gc [--max-size SIZE] [--max-age DAYS] [--prune-images]"
+  exit 1
+}
+
+gc_trim_to_size() {
+  local max_bytes="$1"
+  shift
+
+  local total=0 size
+  while read -r size; do
+    total=$((total + size))
+  done < <(find "$@" -ignore_readdir_race -type f -printf '%s\n' 2>/dev/null)
+
+  # Evict least recently used files first (by access time)
+  local atime path
+  while ((total > max_bytes)) && read -r -d '' atime size path; do
+    rm -f -- "$path" && total=$((total - size))
+  done < <(find "$@" -ignore_readdir_race -type f -mmin +"$GC_GRACE_MINUTES" -printf '%A@ %s %p\0' 2>/dev/null |
+    sort -z -n)
+
+  if ((total > max_bytes)); then
+    echo "yolo: caches still exceed --max-size after trimming (recently used files are kept)" >&2
+  fi
+}
+
+collect_garbage() {
+  local max_size="" max_age="" prune_images=false
+  while [[ $# -gt 0 ]]; do
+    case "$1" in
+    --max-size)
+      [[ $# -ge 2 ]] || gc_usage
+      max_size="$(numfmt --from=iec "$2" 2>/dev/null)" || gc_usage
+      shift 2
+      ;;
+    --max-age)
+      [[ $# -ge 2 && $2 =~ ^[0-9]+$ ]] || gc_usage
+      max_age="$2"
+      shift 2
+      ;;
+    --prune-images)
+      prune_images=true
+      shift
+      ;;
+    *)
+      gc_usage
+      ;;
+    esac
+  done
+
+  local data_dir
+  data_dir="$(get_data_dir)"
+  mkdir -p "$data_dir"
+
+  # Serialize gc runs (e.g. overlapping timer invocations); sandboxes never take this lock
+  local lock_fd
+  exec {lock_fd}>"$data_dir/.gc.lock"
+  if ! flock -n "$lock_fd"; then
+    echo "yolo: another gc is already running" >&2
+    return 0
+  fi
+
+  local cache_dirs=() dir
+  for dir in "${GC_CACHE_DIRS[@]}"; do
+    if [[ -d "$data_dir/$dir" ]]; then
+      cache_dirs+=("$data_dir/$dir")
+    fi
+  done
+
+  # Running sandboxes may delete files while we walk the tree, so tolerate
+  # vanished entries instead of aborting before the remaining policies run
+  if [[ ${#cache_dirs[@]} -gt 0 ]]; then
+    if [[ -n $max_age ]]; then
+      find "${cache_dirs[@]}" -ignore_readdir_race -type f \
+        -mmin +"$((max_age * 1440))" -mmin +"$GC_GRACE_MINUTES" -delete || true
+    fi
+    if [[ -n $max_size ]]; then
+      gc_trim_to_size "$max_size" "${cache_dirs[@]}"
+    fi
+    find "${cache_dirs[@]}" -ignore_readdir_race -mindepth 1 -type d -empty \
+      -mmin +"$GC_GRACE_MINUTES" -delete || true
+  fi
+
+  # Podman storage is only usable from inside the sandbox's user namespace;
+  # podman's own storage lock makes this safe alongside running sandboxes
+  if [[ $prune_images == true ]]; then
+    local status=0
+    run_scratch_sandbox podman image prune --force || status=$?
+    if ((status != 0)); then
+      echo "yolo: podman image prune failed" >&2
+      exec {lock_fd}>&-
+      return "$status"
+    fi
+  fi
+
+  exec {lock_fd}>&-
+}
+
 usage() {
-  echo "Usage: yolo <run|claude|codex|gemini|ralphex> [args...]"
+  echo "Usage: yolo <run|claude|codex|gemini|ralphex|du|gc|ps|top> [args...]"
   exit 1
 }
 
@@ -327,6 +715,18 @@ gemini)
 ralphex)
   run_sandbox ralphex "$@"
   ;;
+du)
+  show_disk_usage
+  ;;
+gc)
+  collect_garbage "$@"
+  ;;
+ps)
+  show_sandboxes
+  ;;
+top)
+  show_top "$@"
+  ;;
 *)
   usage
   ;;